@@ -0,0 +1,100 @@
+from flask import Flask, request
+from flask_sqlalchemy import SQLAlchemy
+from flask_bcrypt import Bcrypt
+from flask_login import LoginManager
+from flask_compress import Compress
+from sessionarchitect.json_provider import OrjsonProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import hashlib
+import os
+import sqlite3
+
+# 1. Initialize our main tools (like global variables)
+db = SQLAlchemy()
+bcrypt = Bcrypt()
+login_manager = LoginManager()
+login_manager.login_view = 'auth.login' # Where to redirect if user isn't logged in
+compress = Compress()
+
+# SQLite only: WAL mode lets reads carry on while a write is in progress
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.close()
+
+# 2. Function to create and configure the app
+def create_app():
+    app = Flask(__name__)
+    
+    # Keep every compiled template in memory instead of Jinja's default 400-entry LRU.
+    # (Template files are only re-checked for changes in debug mode.)
+    app.jinja_options = {**app.jinja_options, 'cache_size': -1}
+    
+    # Serialize JSON responses with orjson (see json_provider.py)
+    app.json = OrjsonProvider(app)
+    
+    # 3. CONFIGURE SECURITY & DATABASE (CRITICAL!)
+    # **********************************************
+    # NOTE: YOU MUST ADD YOUR OWN SECRET_KEY IN YOUR .env FILE
+    app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'default-dev-key') 
+    
+    # Set DATABASE_URL to your PostgreSQL connection string for production.
+    # Without it, we use a simple local SQLite file to get running quickly.
+    database_url = os.environ.get('DATABASE_URL', 'sqlite:///site.db')
+    if database_url.startswith('postgres://'):
+        # Some hosts still hand out postgres://, which SQLAlchemy no longer accepts
+        database_url = database_url.replace('postgres://', 'postgresql://', 1)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    
+    if database_url.startswith('sqlite'):
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'connect_args': {'check_same_thread': False}}
+    else:
+        # Keep a pool of open connections instead of reconnecting on every request
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            'pool_size': 20,
+            'max_overflow': 10,
+            'pool_pre_ping': True,
+            'pool_recycle': 300,
+        }
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    
+    # Compress HTML/JSON/CSS responses (brotli first, gzip fallback).
+    # SSE (text/event-stream) isn't in COMPRESS_MIMETYPES, so event streams are never buffered.
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    
+    # 4. Connect tools to the app
+    db.init_app(app)
+    bcrypt.init_app(app)
+    login_manager.init_app(app)
+    
+    # Flask runs after_request hooks in reverse order, so this runs after Flask-Compress
+    # has added ":br"/":gzip" to the ETag -- the same tag the browser will send back.
+    @app.after_request
+    def check_etag(response):
+        if request.method == 'GET' and response.status_code == 200 and 'ETag' in response.headers:
+            response = response.make_conditional(request)
+        return response
+    
+    compress.init_app(app)
+    
+    # 5. Import and register the different "rooms" (Blueprints)
+    from sessionarchitect.auth.routes import auth
+    from sessionarchitect.generator.routes import generator
+    app.register_blueprint(auth)
+    app.register_blueprint(generator)
+    
+    # 6. Tag GET pages with an ETag so a reopened tab gets a 304, not the full page again.
+    # The tag is a hash of the uncompressed page (gzip output changes every second);
+    # the 304 check itself is check_etag, registered in step 4.
+    @app.after_request
+    def add_etag(response):
+        if (request.method == 'GET' and response.status_code == 200
+                and not response.is_streamed and 'ETag' not in response.headers):
+            body = response.get_data()
+            response.set_etag(hashlib.blake2b(body, digest_size=8).hexdigest())
+        return response
+    
+    return app
\ No newline at end of file
@@ -0,0 +1,152 @@
+import io
+import json
+import time
+
+import markdown
+from flask import current_app
+from openai import OpenAI
+
+from sessionarchitect import db
+from sessionarchitect.models import BatchJob
+
+# Batch statuses after which OpenAI won't change the batch any more
+FINISHED_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+_client = None
+
+def get_client():
+    # Created on first use so importing this module doesn't need OPENAI_API_KEY
+    global _client
+    if _client is None:
+        _client = OpenAI()
+    return _client
+
+def submit_batch(jobs, user_id):
+    """Send chat completion jobs to OpenAI's Batch API (50% cheaper, 24h turnaround).
+
+    Args:
+        jobs: List of dicts with 'custom_id' and 'body' (the chat.completions arguments)
+        user_id: ID of the User the results belong to
+
+    Returns:
+        BatchJob: The saved row tracking this batch
+    """
+    lines = [
+        json.dumps({
+            'custom_id': job['custom_id'],
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': job['body'],
+        })
+        for job in jobs
+    ]
+    jsonl = io.BytesIO('\n'.join(lines).encode('utf-8'))
+
+    client = get_client()
+    input_file = client.files.create(file=('batch.jsonl', jsonl), purpose='batch')
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint='/v1/chat/completions',
+        completion_window='24h',
+    )
+
+    job = BatchJob(user_id=user_id, batch_id=batch.id, status=batch.status)
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+def poll_batches():
+    """Check every unfinished BatchJob and store the results of finished ones.
+
+    Returns:
+        int: Number of batches that finished during this check
+    """
+    client = get_client()
+    finished = 0
+
+    for job in BatchJob.query.filter(BatchJob.status.notin_(FINISHED_STATUSES)).all():
+        batch_id = job.batch_id
+        try:
+            update_job(client, job)
+            # Commit each job on its own so one bad batch can't undo the others
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            current_app.logger.exception('Could not update batch %s', batch_id)
+            continue
+
+        if job.status in FINISHED_STATUSES:
+            finished += 1
+
+    return finished
+
+def update_job(client, job):
+    """Refresh one BatchJob from OpenAI and store its results once it finishes."""
+    batch = client.batches.retrieve(job.batch_id)
+    job.status = batch.status
+
+    if batch.status not in FINISHED_STATUSES:
+        return
+
+    # Expired/cancelled batches can still have partial output, so read whatever files exist
+    results = {}
+    errors = {}
+    if batch.output_file_id:
+        job.result_file_id = batch.output_file_id
+        read_batch_file(client, batch.output_file_id, results, errors)
+    if batch.error_file_id:
+        read_batch_file(client, batch.error_file_id, results, errors)
+
+    job.results = json.dumps(results)
+    job.errors = json.dumps(errors)
+
+def read_batch_file(client, file_id, results, errors):
+    """Sort each line of a batch output/error file into results (HTML) or errors (message).
+
+    Lines are handled one at a time: a malformed line is recorded (or logged, if it
+    has no custom_id) and skipped, so it can't stop the rest of the batch being stored.
+    """
+    for line in client.files.content(file_id).text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            custom_id = item['custom_id']
+        except (ValueError, TypeError, KeyError):
+            current_app.logger.warning('Skipping unreadable line in batch file %s: %.200s', file_id, line)
+            continue
+
+        response = item.get('response') or {}
+        if response.get('status_code') != 200:
+            error = item.get('error') or (response.get('body') or {}).get('error') or {}
+            errors[custom_id] = error.get('message') or 'Request failed'
+            continue
+
+        try:
+            content = response['body']['choices'][0]['message']['content']
+        except (KeyError, IndexError, TypeError):
+            content = None
+        if not content:
+            # e.g. a refusal or tool call -- there's no text to show
+            errors[custom_id] = 'Response had no text content'
+            continue
+        results[custom_id] = markdown.markdown(content, extensions=['tables', 'nl2br'])
+
+def run_worker(interval=30):
+    """Poll pending batches forever. Needs an app context (see __main__ below)."""
+    while True:
+        try:
+            poll_batches()
+        except Exception:
+            # e.g. the database is briefly unreachable -- try again next round
+            db.session.rollback()
+            current_app.logger.exception('Batch polling failed')
+        time.sleep(interval)
+
+if __name__ == '__main__':
+    # Run the background worker with: python -m sessionarchitect.batch
+    from sessionarchitect import create_app
+
+    app = create_app()
+    with app.app_context():
+        run_worker()
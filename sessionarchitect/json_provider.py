@@ -0,0 +1,23 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Drop-in JSON provider for Flask that uses orjson instead of the stdlib json module.
+# jsonify() and request.get_json() go through this, so routes don't need to change.
+class OrjsonProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        # Match the stdlib encoder: allow non-str dict keys, and hand datetimes to
+        # self.default so they keep Flask's HTTP-date format instead of orjson's ISO 8601
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        # orjson returns bytes; Flask expects a str here
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        # orjson has no options like object_hook (the session cookie relies on it),
+        # so anything beyond a plain parse goes to the stdlib-based parent
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -1,5 +1,7 @@
 from sessionarchitect import db, login_manager
 from flask_login import UserMixin
+from sqlalchemy import func
+from datetime import datetime
 
 # Function required by Flask-Login to load a user
 @login_manager.user_loader
@@ -18,5 +20,53 @@ class User(db.Model, UserMixin):
     # Field to track free generations
     generations_this_month = db.Column(db.Integer, default=0)
 
+    def claim_generation(self, limit=None):
+        """Count one generation against this user, atomically.
+
+        The +1 (and the limit check) happen inside a single UPDATE, so two
+        requests at once can't both read the same old count and slip past the limit.
+
+        NOTE: this does NOT commit. The caller must call db.session.commit()
+        (e.g. after saving the generated plan) for the new count to stick.
+
+        Args:
+            limit: Max generations per month (e.g. for the Free tier), or None for no cap
+
+        Returns:
+            bool: False if the user had already used up their limit
+        """
+        # Rows created before the column had a default can hold NULL; count those as 0
+        count = func.coalesce(User.generations_this_month, 0)
+        query = User.query.filter(User.id == self.id)
+        if limit is not None:
+            query = query.filter(count < limit)
+        updated = query.update(
+            {User.generations_this_month: count + 1},
+            synchronize_session='fetch',
+        )
+        return updated == 1
+
+    def __repr__(self):
+        return f"User('{self.email}', '{self.subscription_tier}')"
+
+# A group of generations sent to OpenAI's Batch API (half price, results arrive later)
+class BatchJob(db.Model):
+    __tablename__ = 'batch_jobs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    batch_id = db.Column(db.String(64), unique=True, nullable=False)
+
+    # Mirrors OpenAI's batch status: validating, in_progress, completed, failed, ...
+    status = db.Column(db.String(20), default='validating')
+    result_file_id = db.Column(db.String(64))
+
+    # Filled in once the batch finishes:
+    # results is a JSON object of {custom_id: rendered HTML} for requests that succeeded,
+    # errors is a JSON object of {custom_id: error message} for requests that failed
+    results = db.Column(db.Text)
+    errors = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
     def __repr__(self):
-        return f"User('{self.email}', '{self.subscription_tier}')"
\ No newline at end of file
+        return f"BatchJob('{self.batch_id}', '{self.status}')"
@@ -0,0 +1,76 @@
+import json
+from types import SimpleNamespace
+
+from sessionarchitect import batch, db
+from sessionarchitect.models import BatchJob, User
+
+
+def ok_line(custom_id, content):
+    body = {'choices': [{'message': {'content': content}}]}
+    return json.dumps({'custom_id': custom_id, 'response': {'status_code': 200, 'body': body}})
+
+
+class FakeClient:
+    def __init__(self, batches, files):
+        self.batches = SimpleNamespace(retrieve=lambda batch_id: batches[batch_id])
+        self.files = SimpleNamespace(content=lambda file_id: SimpleNamespace(text=files[file_id]))
+
+
+def make_job(batch_id):
+    user = User(email=f'{batch_id}@example.com', password='hashed')
+    db.session.add(user)
+    db.session.commit()
+    job = BatchJob(user_id=user.id, batch_id=batch_id)
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def test_poll_batches_records_bad_lines_and_finishes_job(app, monkeypatch):
+    job = make_job('batch_1')
+    output = '\n'.join([
+        ok_line('plan-1', '**Goal**'),
+        ok_line('plan-2', None),  # refusal / tool call: no text
+        json.dumps({'custom_id': 'plan-3', 'response': {'status_code': 200, 'body': {}}}),
+        json.dumps({'custom_id': 'plan-4', 'response': {'status_code': 500,
+                    'body': {'error': {'message': 'server error'}}}}),
+        'not json',
+    ])
+    errors_file = json.dumps({'custom_id': 'plan-5', 'response': None,
+                              'error': {'message': 'invalid request'}})
+    client = FakeClient(
+        batches={'batch_1': SimpleNamespace(status='completed', output_file_id='out',
+                                            error_file_id='err')},
+        files={'out': output, 'err': errors_file},
+    )
+    monkeypatch.setattr(batch, '_client', client)
+
+    assert batch.poll_batches() == 1
+
+    job = db.session.get(BatchJob, job.id)
+    assert job.status == 'completed'
+    assert json.loads(job.results) == {'plan-1': '<p><strong>Goal</strong></p>'}
+    assert json.loads(job.errors) == {
+        'plan-2': 'Response had no text content',
+        'plan-3': 'Response had no text content',
+        'plan-4': 'server error',
+        'plan-5': 'invalid request',
+    }
+
+
+def test_poll_batches_keeps_going_when_one_job_fails(app, monkeypatch):
+    flaky = make_job('batch_flaky')
+    done = make_job('batch_done')
+
+    def retrieve(batch_id):
+        if batch_id == 'batch_flaky':
+            raise ConnectionError('temporary network error')
+        return SimpleNamespace(status='completed', output_file_id='out', error_file_id=None)
+
+    client = FakeClient(batches={}, files={'out': ok_line('plan-1', 'Hi')})
+    client.batches = SimpleNamespace(retrieve=retrieve)
+    monkeypatch.setattr(batch, '_client', client)
+
+    assert batch.poll_batches() == 1
+    assert db.session.get(BatchJob, flaky.id).status == 'validating'
+    assert db.session.get(BatchJob, done.id).status == 'completed'
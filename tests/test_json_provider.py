@@ -0,0 +1,41 @@
+import datetime
+
+from flask import Flask, flash, get_flashed_messages, jsonify
+
+from sessionarchitect.json_provider import OrjsonProvider
+
+
+def make_app():
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'test'
+    app.json = OrjsonProvider(app)
+
+    @app.route('/flash')
+    def set_flash():
+        flash('Account created!', 'success')
+        return 'ok'
+
+    @app.route('/messages')
+    def messages():
+        return jsonify(get_flashed_messages(with_categories=True))
+
+    @app.route('/data')
+    def data():
+        return jsonify({1: 'a', 'when': datetime.datetime(2024, 1, 2, 3, 4, 5)})
+
+    return app
+
+
+def test_flash_message_round_trips_through_session():
+    client = make_app().test_client()
+    client.get('/flash')
+    response = client.get('/messages')
+    assert response.status_code == 200
+    assert response.get_json() == [['success', 'Account created!']]
+
+
+def test_matches_stdlib_output_for_int_keys_and_datetimes():
+    client = make_app().test_client()
+    response = client.get('/data')
+    assert response.status_code == 200
+    assert response.get_json() == {'1': 'a', 'when': 'Tue, 02 Jan 2024 03:04:05 GMT'}
@@ -0,0 +1,44 @@
+from sessionarchitect import db
+from sessionarchitect.models import User
+
+
+def make_user(generations=0):
+    user = User(email='clinician@example.com', password='hashed',
+                generations_this_month=generations)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_claim_generation_increments_count(app):
+    user = make_user()
+    assert user.claim_generation() is True
+    assert user.claim_generation() is True
+    db.session.commit()
+    assert db.session.get(User, user.id).generations_this_month == 2
+
+
+def test_claim_generation_stops_at_limit(app):
+    user = make_user(generations=2)
+    assert user.claim_generation(limit=3) is True
+    assert user.claim_generation(limit=3) is False
+    db.session.commit()
+    assert db.session.get(User, user.id).generations_this_month == 3
+
+
+def test_claim_generation_treats_null_count_as_zero(app):
+    user = make_user()
+    # Rows from before the column had a default hold NULL
+    User.query.filter_by(id=user.id).update({User.generations_this_month: None})
+    db.session.commit()
+    assert db.session.get(User, user.id).generations_this_month is None
+    assert user.claim_generation(limit=3) is True
+    db.session.commit()
+    assert db.session.get(User, user.id).generations_this_month == 1
+
+
+def test_claim_generation_leaves_commit_to_caller(app):
+    user = make_user()
+    user.claim_generation()
+    db.session.rollback()
+    assert db.session.get(User, user.id).generations_this_month == 0